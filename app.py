@@ -1,19 +1,18 @@
 import sys
 import sqlite3
-import csv
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QMainWindow, QPushButton, QVBoxLayout, QTableWidget,
     QTableWidgetItem, QComboBox, QMessageBox, QInputDialog, QFileDialog, QScrollArea, QHBoxLayout, QDateEdit, QLabel
 )
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill
 from PyQt5.QtCore import (QDate, Qt)
 from PyQt5.QtGui import QPainter, QFont
 from PyQt5.QtPrintSupport import QPrinter, QPrintDialog
 
+import transactions
+
 
 # Database connection settings
-DB_NAME = "devpresso_db.sqlite"
+DB_NAME = transactions.DB_NAME
 
 class MainMenu(QMainWindow):
     def __init__(self):
@@ -165,23 +164,7 @@ class TransactionsWindow(QWidget):
         self.load_transactions()  # Initial load without filter
 
     def create_table(self):
-        connection = sqlite3.connect(DB_NAME)
-        cursor = connection.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS transactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                customer_name TEXT,
-                drink_type TEXT,
-                variant TEXT,
-                quantity INTEGER,
-                total_price REAL,
-                date TEXT,
-                paid BOOLEAN DEFAULT 0,  -- New column for paid status
-                payment_method TEXT DEFAULT '-' -- New column for payment method
-            )
-        """)
-        connection.commit()
-        connection.close()
+        transactions.create_table(DB_NAME)
 
     def load_transactions(self):
         # Get selected start and end dates
@@ -432,35 +415,11 @@ class TransactionsWindow(QWidget):
         options = QFileDialog.Options()
         file_name, _ = QFileDialog.getSaveFileName(self, "Save Transactions", "", "CSV Files (*.csv);;All Files (*)", options=options)
         if file_name:
-            connection = sqlite3.connect(DB_NAME)
-            cursor = connection.cursor()
-            cursor.execute("""
-                SELECT date, customer_name, drink_type, variant, quantity, total_price, 
-                    CASE WHEN paid = 1 THEN 'True' ELSE 'False' END as paid, payment_method 
-                FROM transactions
-                WHERE date BETWEEN ? AND ?
-            """, (start_date, end_date))
-            records = cursor.fetchall()
-            connection.close()
-
-            # Calculating totals for quantity and amount as integers
-            total_quantity = sum(int(record[4]) for record in records)  # column 4 is quantity
-            total_amount = sum(int(record[5]) for record in records)  # column 5 is total_price
-            total_paid_true = sum(1 for record in records if record[6] == 'True')  # Count 'True' values for paid
+            records = transactions.fetch_export_records(start_date, end_date, DB_NAME)
 
             # Writing data to CSV file
             with open(file_name, mode="w", newline="") as file:
-                writer = csv.writer(file)
-                writer.writerow(["Date", "Customer Name", "Drink Type", "Variant", "Quantity", "Total Price (Rp)", "Paid", "Payment Method"])
-                for row in records:
-                    formatted_row = list(row)
-                    formatted_row[5] = int(formatted_row[5])  # Convert total_price to integer
-                    writer.writerow(formatted_row)
-
-                # Add totals row with 'Paid' column count (e.g., 2/3)
-                paid_ratio = f"{total_paid_true}/{len(records)}"
-                total_row = ["", "", "", "Total", total_quantity, total_amount, paid_ratio, ""]
-                writer.writerow(total_row)
+                transactions.write_csv(records, file)
 
             QMessageBox.information(self, "Success", f"Transactions saved to {file_name}")
 
@@ -470,60 +429,10 @@ class TransactionsWindow(QWidget):
             options = QFileDialog.Options()
             file_name, _ = QFileDialog.getSaveFileName(self, "Save Transactions", "", "Excel Files (*.xlsx);;All Files (*)", options=options)
             if file_name:
-                connection = sqlite3.connect(DB_NAME)
-                cursor = connection.cursor()
-                cursor.execute("""
-                    SELECT date, customer_name, drink_type, variant, quantity, total_price, 
-                        CASE WHEN paid = 1 THEN 'True' ELSE 'False' END as paid, payment_method 
-                    FROM transactions
-                    WHERE date BETWEEN ? AND ?
-                """, (start_date, end_date))
-                records = cursor.fetchall()
-                connection.close()
-
-                # Calculating totals for quantity and amount as integers
-                total_quantity = sum(int(record[4]) for record in records)  # column 4 is quantity
-                total_amount = sum(int(record[5]) for record in records)  # column 5 is total_price
-                total_paid_true = sum(1 for record in records if record[6] == 'True')  # Count 'True' values for paid
+                records = transactions.fetch_export_records(start_date, end_date, DB_NAME)
 
                 # Writing data to Excel file
-                workbook = Workbook()
-                sheet = workbook.active
-                sheet.title = "Transactions"
-                
-                # Add header row
-                headers = ["Date", "Customer Name", "Drink Type", "Variant", "Quantity", "Total Price (Rp)", "Paid", "Payment Method"]
-                sheet.append(headers)
-
-                # Style the header row
-                header_fill = PatternFill(start_color="FFC000", end_color="FFC000", fill_type="solid")
-                header_font = Font(bold=True, color="FFFFFF")
-                header_alignment = Alignment(horizontal="center")
-
-                for col_num, header in enumerate(headers, start=1):
-                    cell = sheet.cell(row=1, column=col_num)
-                    cell.fill = header_fill
-                    cell.font = header_font
-                    cell.alignment = header_alignment
-
-                # Data rows
-                for row in records:
-                    formatted_row = list(row)
-                    formatted_row[5] = int(formatted_row[5])  # Ensure total_price is stored as an integer
-                    sheet.append(formatted_row)
-
-                # Total row at the bottom
-                paid_ratio = f"{total_paid_true}/{len(records)}"
-                total_row = ["", "", "", "Total", total_quantity, total_amount, paid_ratio, ""]
-                sheet.append(total_row)
-
-                # Apply formatting for thousands separator
-                for row_idx in range(2, len(records) + 3):  # Rows with data and total
-                    sheet.cell(row=row_idx, column=6).number_format = '#,##0'  # Format Total Price (Rp)
-                sheet.cell(row=len(records) + 3, column=5).number_format = '#,##0'  # Format Total Quantity
-                sheet.cell(row=len(records) + 3, column=6).number_format = '#,##0'  # Format Total Amount
-
-                workbook.save(file_name)
+                transactions.write_excel(records, file_name)
                 QMessageBox.information(self, "Success", f"Transactions saved to {file_name}")
 
 
@@ -0,0 +1,196 @@
+"""Headless Devpresso command line for batch jobs.
+
+Reuses the export logic of the Transactions window without importing PyQt5:
+
+    python cli.py export --start 2024-12-01 --end 2024-12-31 --format xlsx -o december.xlsx
+    python cli.py totals --start 2024-12-01 --end 2024-12-31
+    python cli.py import december.csv  # appends, run it once per file
+    python cli.py vacuum
+    python cli.py benchmark --repeat 10
+"""
+import argparse
+import datetime
+import io
+import os
+import sqlite3
+import sys
+import time
+
+import transactions
+
+
+def open_output(path):
+    # "-" (or no path) streams to stdout
+    if path in (None, "-"):
+        # Match open(..., newline=""), otherwise csv's \r\n becomes \r\r\n on Windows
+        sys.stdout.reconfigure(newline="")
+        return sys.stdout, False
+    return open(path, mode="w", newline=""), True
+
+
+def cmd_export(args):
+    records = transactions.fetch_export_records(args.start, args.end, args.db)
+
+    if args.format == "xlsx":
+        # write_excel opens the path itself, so a failed export leaves no empty file behind
+        try:
+            if args.output in (None, "-"):
+                # openpyxl needs a seekable file, so buffer it before writing to stdout
+                buffer = io.BytesIO()
+                transactions.write_excel(records, buffer)
+                sys.stdout.buffer.write(buffer.getvalue())
+                sys.stdout.buffer.flush()
+            else:
+                transactions.write_excel(records, args.output)
+        except ImportError:
+            print("Excel export requires openpyxl", file=sys.stderr)
+            return 1
+        return 0
+
+    file, should_close = open_output(args.output)
+    try:
+        transactions.write_csv(records, file)
+    finally:
+        if should_close:
+            file.close()
+        else:
+            file.flush()
+    return 0
+
+
+def cmd_totals(args):
+    records = transactions.fetch_day_totals(args.start, args.end, args.db)
+
+    file, should_close = open_output(args.output)
+    try:
+        file.write(f"{'Date':<12}{'Count':>8}{'Quantity':>10}{'Total (Rp)':>16}{'Paid':>10}\n")
+        total_count = total_quantity = total_amount = total_paid = 0
+        for date, count, quantity, amount, paid in records:
+            file.write(f"{date:<12}{count:>8}{int(quantity):>10}{format_rupiah(amount):>16}{f'{paid}/{count}':>10}\n")
+            total_count += count
+            total_quantity += int(quantity)
+            total_amount += int(amount)
+            total_paid += paid
+        file.write(f"{'Total':<12}{total_count:>8}{total_quantity:>10}{format_rupiah(total_amount):>16}{f'{total_paid}/{total_count}':>10}\n")
+    finally:
+        if should_close:
+            file.close()
+        else:
+            file.flush()
+    return 0
+
+
+def cmd_import(args):
+    try:
+        if args.input == "-":
+            count = transactions.import_csv(sys.stdin, args.db)
+        else:
+            with open(args.input, mode="r", newline="") as file:
+                count = transactions.import_csv(file, args.db)
+    except ValueError as error:
+        print(f"Cannot import {args.input}: {error}", file=sys.stderr)
+        return 1
+    print(f"Imported {count} transactions into {args.db}", file=sys.stderr)
+    return 0
+
+
+def cmd_vacuum(args):
+    size_before = os.path.getsize(args.db) if os.path.exists(args.db) else 0
+    transactions.optimize_database(args.db)
+    size_after = os.path.getsize(args.db)
+    print(f"Optimized {args.db}: {size_before:,} -> {size_after:,} bytes", file=sys.stderr)
+    return 0
+
+
+def cmd_benchmark(args):
+    repeat = max(args.repeat, 1)
+    timings = {"query": [], "csv": []}
+    for _ in range(repeat):
+        started = time.perf_counter()
+        records = transactions.fetch_export_records(args.start, args.end, args.db)
+        timings["query"].append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        transactions.write_csv(records, io.StringIO(newline=""))
+        timings["csv"].append(time.perf_counter() - started)
+
+    print(f"{len(records)} transactions between {args.start} and {args.end}, {repeat} runs")
+    for name, values in timings.items():
+        print(f"{name:<6} min {min(values) * 1000:8.2f} ms   avg {sum(values) / len(values) * 1000:8.2f} ms")
+    return 0
+
+
+def format_rupiah(amount):
+    # Same thousands separator as the Transactions table
+    return f"{int(amount):,}".replace(",", ".")
+
+
+def parse_date(value):
+    # Validate the format the transactions table stores (yyyy-MM-dd)
+    try:
+        return datetime.date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}', expected YYYY-MM-DD")
+
+
+def add_date_range(parser):
+    # Defaults to today, like the date filter in the Transactions window
+    today = datetime.date.today().isoformat()
+    parser.add_argument("--start", type=parse_date, default=today, help="start date (YYYY-MM-DD, default: today)")
+    parser.add_argument("--end", type=parse_date, default=today, help="end date (YYYY-MM-DD, default: today)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="devpresso", description="Headless Devpresso batch operations.")
+    parser.add_argument("--db", default=transactions.DB_NAME, help=f"SQLite database (default: {transactions.DB_NAME})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="export transactions to CSV or Excel")
+    add_date_range(export_parser)
+    export_parser.add_argument("--format", choices=["csv", "xlsx"], default="csv")
+    export_parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    export_parser.set_defaults(func=cmd_export)
+
+    totals_parser = subparsers.add_parser("totals", help="print totals per day")
+    add_date_range(totals_parser)
+    totals_parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    totals_parser.set_defaults(func=cmd_totals)
+
+    import_parser = subparsers.add_parser(
+        "import",
+        help="append transactions from an exported CSV",
+        description="Append transactions from an exported CSV. Rows are not deduplicated, "
+                    "so importing the same file twice adds its transactions twice.",
+    )
+    import_parser.add_argument("input", help="CSV file, or - for stdin")
+    import_parser.add_argument("--create", action="store_true", help="create the database if it does not exist")
+    import_parser.set_defaults(func=cmd_import)
+
+    vacuum_parser = subparsers.add_parser("vacuum", help="vacuum and optimize the database")
+    vacuum_parser.set_defaults(func=cmd_vacuum)
+
+    benchmark_parser = subparsers.add_parser("benchmark", help="time the export query and CSV writer")
+    add_date_range(benchmark_parser)
+    benchmark_parser.add_argument("--repeat", type=int, default=5)
+    benchmark_parser.set_defaults(func=cmd_benchmark)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if not os.path.exists(args.db) and not getattr(args, "create", False):
+        print(f"Database not found: {args.db}", file=sys.stderr)
+        return 1
+    try:
+        return args.func(args)
+    except sqlite3.Error as error:
+        print(f"Database error in {args.db}: {error}", file=sys.stderr)
+        return 1
+    except OSError as error:
+        print(f"Cannot open {error.filename}: {error.strerror}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
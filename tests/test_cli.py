@@ -0,0 +1,196 @@
+import csv
+import io
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import cli
+import transactions
+
+
+# Cold start of `python cli.py totals`, generous enough for slow CI machines
+COLD_START_LIMIT = 2.0
+
+RECORDS = [
+    ("Ani", "Coffee", "Latte", 2, 50000.7, "2024-12-01", 1, "QRIS"),
+    ("Budi", "Tea", "Iced", 1, 15000.7, "2024-12-01", 0, "-"),
+    ("Citra", "Coffee", "Mocha", 3, 90000, "2024-12-02", 1, "Cash"),
+    ("Dewi", "Tea", "Hot", 1, 12000, "2025-01-05", 1, "Cash"),
+]
+
+
+@pytest.fixture
+def db(tmp_path):
+    db_name = str(tmp_path / "devpresso_db.sqlite")
+    transactions.create_table(db_name)
+    connection = sqlite3.connect(db_name)
+    connection.executemany(
+        "INSERT INTO transactions (customer_name, drink_type, variant, quantity, total_price, date, paid, payment_method) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        RECORDS
+    )
+    connection.commit()
+    connection.close()
+    return db_name
+
+
+def run_cli(*args):
+    # Runs cli.py in a fresh interpreter so no other test's imports leak in
+    return subprocess.run(
+        [sys.executable, os.path.join(ROOT, "cli.py"), *args],
+        capture_output=True, text=True, cwd=ROOT
+    )
+
+
+def test_export_csv(db, tmp_path):
+    output = tmp_path / "december.csv"
+    assert cli.main(["--db", db, "export", "--start", "2024-12-01", "--end", "2024-12-31", "-o", str(output)]) == 0
+
+    assert output.read_bytes().count(b"\r\n") == 5
+    with open(output, newline="") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == transactions.EXPORT_HEADERS
+    assert rows[1] == ["2024-12-01", "Ani", "Coffee", "Latte", "2", "50000", "True", "QRIS"]
+    assert rows[-1] == ["", "", "", "Total", "6", "155000", "2/3", ""]
+
+
+def test_export_csv_to_stdout_matches_file(db, tmp_path, capsys):
+    output = tmp_path / "december.csv"
+    cli.main(["--db", db, "export", "--start", "2024-12-01", "--end", "2024-12-31", "-o", str(output)])
+    cli.main(["--db", db, "export", "--start", "2024-12-01", "--end", "2024-12-31"])
+
+    with open(output, newline="") as file:
+        assert capsys.readouterr().out == file.read()
+
+
+def test_export_xlsx(db, tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    output = tmp_path / "december.xlsx"
+    assert cli.main(["--db", db, "export", "--start", "2024-12-01", "--end", "2024-12-31", "--format", "xlsx", "-o", str(output)]) == 0
+
+    rows = list(openpyxl.load_workbook(output).active.values)
+    assert list(rows[0]) == transactions.EXPORT_HEADERS
+    assert rows[3] == ("2024-12-02", "Citra", "Coffee", "Mocha", 3, 90000, "True", "Cash")
+    assert rows[4][3:7] == ("Total", 6, 155000, "2/3")
+
+
+def test_export_xlsx_to_stdout_matches_file(db, tmp_path, capsysbinary):
+    openpyxl = pytest.importorskip("openpyxl")
+    output = tmp_path / "december.xlsx"
+    cli.main(["--db", db, "export", "--start", "2024-12-01", "--end", "2024-12-31", "--format", "xlsx", "-o", str(output)])
+    assert cli.main(["--db", db, "export", "--start", "2024-12-01", "--end", "2024-12-31", "--format", "xlsx"]) == 0
+
+    streamed = openpyxl.load_workbook(io.BytesIO(capsysbinary.readouterr().out))
+    assert list(streamed.active.values) == list(openpyxl.load_workbook(output).active.values)
+
+
+def test_totals_match_export_total(db, capsys):
+    assert cli.main(["--db", db, "totals", "--start", "2024-12-01", "--end", "2024-12-31"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[1].split() == ["2024-12-01", "2", "3", "65.000", "1/2"]
+    assert lines[2].split() == ["2024-12-02", "1", "3", "90.000", "1/1"]
+    assert lines[3].split() == ["Total", "3", "6", "155.000", "2/3"]
+
+
+def test_import_round_trip(db, tmp_path):
+    exported = io.StringIO(newline="")
+    transactions.write_csv(transactions.fetch_export_records("2024-12-01", "2024-12-31", db), exported)
+    source = tmp_path / "december.csv"
+    source.write_text(exported.getvalue(), newline="")
+
+    target = str(tmp_path / "imported.sqlite")
+    assert cli.main(["--db", target, "import", "--create", str(source)]) == 0
+    assert transactions.fetch_day_totals("2024-12-01", "2024-12-31", target) == [
+        ("2024-12-01", 2, 3, 65000, 1),
+        ("2024-12-02", 1, 3, 90000, 1),
+    ]
+
+
+def test_import_requires_existing_db(tmp_path, capsys):
+    source = tmp_path / "empty.csv"
+    source.write_text(",".join(transactions.EXPORT_HEADERS) + "\n")
+    target = tmp_path / "typo.sqlite"
+
+    assert cli.main(["--db", str(target), "import", str(source)]) == 1
+    assert "Database not found" in capsys.readouterr().err
+    assert not target.exists()
+
+
+@pytest.mark.parametrize("bad_row", [
+    "2024-12-03,Fajar,Coffee,Latte,,25000,False,-",
+    "2024-12-03,Fajar,Coffee,Latte,1,25000,TRUE,-",
+    "01/12/2024,Fajar,Coffee,Latte,1,25000,False,-",
+])
+def test_import_reports_bad_line(db, tmp_path, capsys, bad_row):
+    source = tmp_path / "bad.csv"
+    source.write_text(
+        ",".join(transactions.EXPORT_HEADERS) + "\n"
+        "2024-12-03,Eka,Coffee,Latte,1,25000,True,QRIS\n"
+        + bad_row + "\n"
+    )
+
+    assert cli.main(["--db", db, "import", str(source)]) == 1
+    assert "line 3" in capsys.readouterr().err
+    assert transactions.fetch_day_totals("2024-12-03", "2024-12-03", db) == []
+
+
+def test_vacuum(db, capsys):
+    assert cli.main(["--db", db, "vacuum"]) == 0
+
+    assert capsys.readouterr().err.startswith(f"Optimized {db}: ")
+    assert len(transactions.fetch_export_records("2024-01-01", "2025-12-31", db)) == len(RECORDS)
+
+
+def test_benchmark(db, capsys):
+    assert cli.main(["--db", db, "benchmark", "--start", "2024-12-01", "--end", "2024-12-31", "--repeat", "2"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "3 transactions between 2024-12-01 and 2024-12-31, 2 runs"
+    assert [line.split()[0] for line in lines[1:]] == ["query", "csv"]
+
+
+def test_missing_table_is_reported(tmp_path, capsys):
+    db_name = str(tmp_path / "other.sqlite")
+    sqlite3.connect(db_name).close()
+
+    assert cli.main(["--db", db_name, "totals"]) == 1
+    assert "no such table: transactions" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("command", [
+    ["import", "missing.csv"],
+    ["export", "-o", os.path.join("missing", "december.csv")],
+])
+def test_file_errors_are_reported(db, tmp_path, monkeypatch, capsys, command):
+    monkeypatch.chdir(tmp_path)
+
+    assert cli.main(["--db", db, *command]) == 1
+    assert "Cannot open" in capsys.readouterr().err
+
+
+def test_cli_does_not_import_pyqt5(db):
+    script = (
+        "import sys, cli\n"
+        f"cli.main(['--db', {db!r}, 'export', '--start', '2024-12-01', '--end', '2024-12-31'])\n"
+        "assert 'PyQt5' not in sys.modules\n"
+        "assert 'openpyxl' not in sys.modules\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, cwd=ROOT)
+    assert result.returncode == 0, result.stderr
+
+
+def test_cli_cold_start(db):
+    started = time.perf_counter()
+    result = run_cli("--db", db, "totals", "--start", "2024-12-01", "--end", "2024-12-31")
+    elapsed = time.perf_counter() - started
+
+    assert result.returncode == 0, result.stderr
+    print(f"cli.py totals cold start: {elapsed * 1000:.0f} ms")
+    assert elapsed < COLD_START_LIMIT
@@ -0,0 +1,176 @@
+import csv
+import datetime
+import sqlite3
+
+
+# Database connection settings
+DB_NAME = "devpresso_db.sqlite"
+
+# Column headers shared by the CSV and Excel exports
+EXPORT_HEADERS = ["Date", "Customer Name", "Drink Type", "Variant", "Quantity", "Total Price (Rp)", "Paid", "Payment Method"]
+
+
+def create_table(db_name=DB_NAME):
+    connection = sqlite3.connect(db_name)
+    cursor = connection.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS transactions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            customer_name TEXT,
+            drink_type TEXT,
+            variant TEXT,
+            quantity INTEGER,
+            total_price REAL,
+            date TEXT,
+            paid BOOLEAN DEFAULT 0,  -- New column for paid status
+            payment_method TEXT DEFAULT '-' -- New column for payment method
+        )
+    """)
+    connection.commit()
+    connection.close()
+
+
+def fetch_export_records(start_date, end_date, db_name=DB_NAME):
+    connection = sqlite3.connect(db_name)
+    cursor = connection.cursor()
+    cursor.execute("""
+        SELECT date, customer_name, drink_type, variant, quantity, total_price,
+            CASE WHEN paid = 1 THEN 'True' ELSE 'False' END as paid, payment_method
+        FROM transactions
+        WHERE date BETWEEN ? AND ?
+    """, (start_date, end_date))
+    records = cursor.fetchall()
+    connection.close()
+    return records
+
+
+def build_total_row(records):
+    # Calculating totals for quantity and amount as integers
+    total_quantity = sum(int(record[4]) for record in records)  # column 4 is quantity
+    total_amount = sum(int(record[5]) for record in records)  # column 5 is total_price
+    total_paid_true = sum(1 for record in records if record[6] == 'True')  # Count 'True' values for paid
+
+    # Totals row with 'Paid' column count (e.g., 2/3)
+    paid_ratio = f"{total_paid_true}/{len(records)}"
+    return ["", "", "", "Total", total_quantity, total_amount, paid_ratio, ""]
+
+
+def write_csv(records, file):
+    # Writing data to an already opened text file (opened with newline="")
+    writer = csv.writer(file)
+    writer.writerow(EXPORT_HEADERS)
+    for row in records:
+        formatted_row = list(row)
+        formatted_row[5] = int(formatted_row[5])  # Convert total_price to integer
+        writer.writerow(formatted_row)
+
+    writer.writerow(build_total_row(records))
+
+
+def write_excel(records, file):
+    # Imported here so CSV-only callers don't pay for loading openpyxl
+    from openpyxl import Workbook
+    from openpyxl.styles import Font, Alignment, PatternFill
+
+    # Writing data to Excel file (a path or a binary file object)
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Transactions"
+
+    # Add header row
+    sheet.append(EXPORT_HEADERS)
+
+    # Style the header row
+    header_fill = PatternFill(start_color="FFC000", end_color="FFC000", fill_type="solid")
+    header_font = Font(bold=True, color="FFFFFF")
+    header_alignment = Alignment(horizontal="center")
+
+    for col_num, header in enumerate(EXPORT_HEADERS, start=1):
+        cell = sheet.cell(row=1, column=col_num)
+        cell.fill = header_fill
+        cell.font = header_font
+        cell.alignment = header_alignment
+
+    # Data rows
+    for row in records:
+        formatted_row = list(row)
+        formatted_row[5] = int(formatted_row[5])  # Ensure total_price is stored as an integer
+        sheet.append(formatted_row)
+
+    # Total row at the bottom
+    sheet.append(build_total_row(records))
+
+    # Apply formatting for thousands separator
+    for row_idx in range(2, len(records) + 3):  # Rows with data and total
+        sheet.cell(row=row_idx, column=6).number_format = '#,##0'  # Format Total Price (Rp)
+    sheet.cell(row=len(records) + 3, column=5).number_format = '#,##0'  # Format Total Quantity
+    sheet.cell(row=len(records) + 3, column=6).number_format = '#,##0'  # Format Total Amount
+
+    workbook.save(file)
+
+
+def fetch_day_totals(start_date, end_date, db_name=DB_NAME):
+    # One row per day: date, transaction count, quantity, amount, paid count.
+    # Values are truncated per row before summing, like build_total_row does
+    connection = sqlite3.connect(db_name)
+    cursor = connection.cursor()
+    cursor.execute("""
+        SELECT date, COUNT(*), COALESCE(SUM(CAST(quantity AS INTEGER)), 0), COALESCE(SUM(CAST(total_price AS INTEGER)), 0),
+            SUM(CASE WHEN paid = 1 THEN 1 ELSE 0 END)
+        FROM transactions
+        WHERE date BETWEEN ? AND ?
+        GROUP BY date
+        ORDER BY date
+    """, (start_date, end_date))
+    records = cursor.fetchall()
+    connection.close()
+    return records
+
+
+def import_csv(file, db_name=DB_NAME):
+    # Reads rows in the export format; the trailing totals row is skipped.
+    # Raises ValueError naming the line of the first bad row, before anything is inserted
+    reader = csv.DictReader(file)
+    rows = []
+    for row in reader:
+        try:
+            if not row["Date"] and row["Variant"] == "Total":
+                continue
+            if row["Paid"] not in ("True", "False"):
+                raise ValueError(f"invalid Paid value {row['Paid']!r}, expected True or False")
+            rows.append((
+                row["Customer Name"],
+                row["Drink Type"],
+                row["Variant"],
+                int(row["Quantity"]),
+                int(float(row["Total Price (Rp)"])),
+                # Queries filter with BETWEEN on yyyy-MM-dd strings, so other formats would be unreachable
+                datetime.date.fromisoformat(row["Date"]).isoformat(),
+                1 if row["Paid"] == "True" else 0,
+                row["Payment Method"] or "-",
+            ))
+        except KeyError as error:
+            raise ValueError(f"line {reader.line_num}: missing column {error}")
+        except (TypeError, ValueError) as error:
+            # TypeError covers short rows, where DictReader fills missing fields with None
+            raise ValueError(f"line {reader.line_num}: {error}")
+
+    create_table(db_name)
+    connection = sqlite3.connect(db_name)
+    cursor = connection.cursor()
+    cursor.executemany(
+        "INSERT INTO transactions (customer_name, drink_type, variant, quantity, total_price, date, paid, payment_method) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        rows
+    )
+    connection.commit()
+    cursor.close()
+    connection.close()
+    return len(rows)
+
+
+def optimize_database(db_name=DB_NAME):
+    # isolation_level=None because VACUUM cannot run inside a transaction
+    connection = sqlite3.connect(db_name, isolation_level=None)
+    connection.execute("VACUUM")
+    connection.execute("PRAGMA optimize")
+    connection.close()